@@ -1,10 +1,17 @@
 #!/usr/bin/env python
 import os
 import sys
-from pkg_resources import get_distribution, DistributionNotFound
 try:
-    __version__ = get_distribution(__name__).version
-except DistributionNotFound:
+    # `importlib.metadata` is much cheaper to import than `pkg_resources` (Python 3.8+)
+    from importlib.metadata import version as _get_version, PackageNotFoundError
+except ImportError:
+    from pkg_resources import get_distribution, DistributionNotFound as PackageNotFoundError
+
+    def _get_version(name):
+        return get_distribution(name).version
+try:
+    __version__ = _get_version(__name__)
+except PackageNotFoundError:
     # package is not installed
     pass
 
@@ -93,10 +93,10 @@ cdef class Component:
             self._name = name
 
     cpdef setup(self):
-        logger.debug('Setting up {}: "{}"'.format(self.__class__.__name__, self.name))
+        logger.debug('Setting up %s: "%s"', self.__class__.__name__, self._name)
 
     cpdef reset(self):
-        logger.debug('Resetting up {}: "{}"'.format(self.__class__.__name__, self.name))
+        logger.debug('Resetting up %s: "%s"', self.__class__.__name__, self._name)
 
     cpdef before(self):
         pass
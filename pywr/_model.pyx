@@ -370,6 +370,8 @@ class Model(object):
             return components_data
 
         model._parameters_to_load = collect_components(data, "parameters")
+        # Cache of parameters loaded by name; used by `load_parameter` to resolve references
+        model._loaded_parameters = {}
         model._recorders_to_load = collect_components(data, "recorders")
 
         @listify
@@ -393,6 +395,7 @@ class Model(object):
 
         del(model._recorders_to_load)
         del(model._parameters_to_load)
+        del(model._loaded_parameters)
         del(model._nodes_to_load)
 
         # load edges
@@ -612,6 +615,7 @@ class Model(object):
     def setup(self, ):
         """Setup the model for the first time or if it has changed since
         last run."""
+        cdef Component component
         logger.info('Setting up model ...')
         self.timestepper.setup()
         self.scenarios.setup()
@@ -619,7 +623,7 @@ class Model(object):
         for node in self.graph.nodes():
             node.setup(self)
 
-        components = self.flatten_component_tree(rebuild=True)
+        cdef list components = self.flatten_component_tree(rebuild=True)
         for component in components:
             component.setup()
 
@@ -630,6 +634,7 @@ class Model(object):
 
     def reset(self, start=None):
         """Reset model to it's initial conditions"""
+        cdef Component component
         logger.info('Resetting model ...')
         length_changed = self.timestepper.reset(start=start)
         for node in self.nodes:
@@ -637,7 +642,7 @@ class Model(object):
                 node.setup(self)
             node.reset()
 
-        components = self.flatten_component_tree(rebuild=False)
+        cdef list components = self.flatten_component_tree(rebuild=False)
         for component in components:
             if length_changed:
                 component.setup()
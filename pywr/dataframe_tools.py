@@ -1,4 +1,5 @@
 """Utilities for working with pandas DataFrame objects."""
+import numpy as np
 import pandas
 from pandas.tseries.offsets import Tick, DateOffset
 from  pandas._libs.tslibs.period import IncompatibleFrequency
@@ -36,6 +37,14 @@ def align_and_resample_dataframe(df, target_index, resample_func='mean'):
     resample_func : str, func
         Function to be used when down-sampling from high frequency data to lower
         frequency.
+
+    Returns
+    =======
+
+    `pandas.DataFrame`
+        The aligned and resampled data. If the input is already at the target
+        frequency no resampling is done and the result may be a view of the
+        input data; callers that need to modify or own the values must copy them.
      
     """
     # Must resample and align the DataFrame to the model.
@@ -58,13 +67,23 @@ def align_and_resample_dataframe(df, target_index, resample_func='mean'):
     model_freq = target_index.freq
     df_freq = df.index.freq
 
+    aligned_df = None
+    if df_freq == model_freq:
+        # The data is already at the model frequency; if it is also aligned no resampling is required.
+        # Note the sliced result may be a view of the input data.
+        aligned_df = df[start:end]
+        if not aligned_df.index.equals(target_index):
+            aligned_df = None
+
     # Determine how to do the resampling based on the frequency type
     # and whether to do up or down sampling.
-    if isinstance(model_freq, Tick):
+    if aligned_df is not None:
+        df = aligned_df
+    elif isinstance(model_freq, Tick):
         # Model is tick based e.g. daily or hourly
         if isinstance(df_freq, Tick):
-            # Dataframe is also tick based
-            if model_freq >= df_freq:
+            # Dataframe is also tick based; ticks are fixed frequencies so compare their lengths directly
+            if model_freq.nanos >= df_freq.nanos:
                 # Down sampling (i.e. from high freq to lower model freq)
                 df = _down_sample_tick_to_tick(df, target_index, resample_func)
             else:
@@ -88,7 +107,8 @@ def align_and_resample_dataframe(df, target_index, resample_func='mean'):
             except IncompatibleFrequency:
                 raise ResamplingError(df, target_index)
 
-    df = df[start:end]
+    if aligned_df is None:
+        df = df[start:end]
 
     if not df.index.equals(target_index):
         raise ResamplingError(df, target_index)
@@ -119,11 +139,48 @@ def _down_sample_tick_to_tick(df, target_index, resample_func):
     start = target_index[0].asfreq(df.index.freq, how='start')
     end = target_index[-1].asfreq(df.index.freq, how='end')
     new_df = df[start:end]
+    if resample_func == 'mean':
+        # Tick frequencies are fixed length; try to avoid the general resampling machinery.
+        mean_df = _mean_of_regular_bins(new_df, target_index, start, end)
+        if mean_df is not None:
+            return mean_df
     # Second we re-sample the aligned data
     new_df = new_df.resample(target_index.freq).agg(resample_func)
     return new_df
 
 
+def _mean_of_regular_bins(df, target_index, start, end):
+    """Compute the mean of aligned tick data in equal sized bins of the target index.
+
+    Each period of the target index contains the same whole number of periods of
+    the data. If the data covers `start` to `end` completely the values can be
+    reshaped to one row per target period and averaged directly.
+
+    Returns `None` if this is not possible (e.g. incomplete or missing data), in
+    which case the caller should fall back to `resample`.
+    """
+    n = len(target_index)
+    bin_size, remainder = divmod(target_index.freq.nanos, df.index.freq.nanos)
+    if remainder != 0 or len(df) != n * bin_size:
+        return None
+    if df.index[0] != start or df.index[-1] != end:
+        return None
+    if not (df.index.is_monotonic_increasing and df.index.is_unique):
+        return None
+
+    values = df.values
+    if values.dtype.kind not in 'iuf':
+        return None
+    means = values.reshape(n, bin_size, -1).mean(axis=1)
+    if np.isnan(means).any():
+        # Let pandas deal with missing values.
+        return None
+
+    if df.ndim == 1:
+        return pandas.Series(means[:, 0], index=target_index, name=df.name)
+    return pandas.DataFrame(means, index=target_index, columns=df.columns)
+
+
 def _resample_date_offset_to_tick(df, target_index, resample_func):
     """Re-sample a date offset to tick based index."""
 
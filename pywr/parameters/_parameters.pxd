@@ -28,9 +28,10 @@ cdef class Parameter(Component):
 
 cdef class ConstantParameter(Parameter):
     cdef double _value
-    cdef public double scale, offset
+    cdef double _scale, _offset
     cdef double[:] _lower_bounds
     cdef double[:] _upper_bounds
+    cdef _update_values(self)
 
 cdef class DataFrameParameter(Parameter):
     cdef double[:,:] _values
@@ -135,6 +136,7 @@ cdef class AggregatedParameter(Parameter):
     cdef public list parameters
     cdef object _agg_user_func
     cdef int _agg_func
+    cdef double[:, :] _buffer
     cpdef double value(self, Timestep timestep, ScenarioIndex scenario_index) except? -1
     cpdef add(self, Parameter parameter)
     cpdef remove(self, Parameter parameter)
@@ -155,6 +157,10 @@ cdef class DivisionParameter(Parameter):
     cdef Parameter _denominator
 
 
+cdef class ScaledProfileParameter(Parameter):
+    cdef public double scale
+    cdef public Parameter profile
+
 cdef class NegativeParameter(Parameter):
     cdef public Parameter parameter
 
@@ -119,22 +119,53 @@ cdef class ConstantParameter(Parameter):
     def __init__(self, model, value, lower_bounds=0.0, upper_bounds=np.inf, scale=1.0, offset=0.0, **kwargs):
         super(ConstantParameter, self).__init__(model, **kwargs)
         self._value = value
-        self.scale = scale
-        self.offset = offset
+        self._scale = scale
+        self._offset = offset
         self.double_size = 1
         self.integer_size = 0
-        self._lower_bounds = np.ones(self.double_size) * lower_bounds
-        self._upper_bounds = np.ones(self.double_size) * upper_bounds
+        self._lower_bounds = np.full(self.double_size, lower_bounds, dtype=np.float64)
+        self._upper_bounds = np.full(self.double_size, upper_bounds, dtype=np.float64)
+        # Values are not allocated until `setup`
+        self.__values = None
+
+    property scale:
+        def __get__(self):
+            return self._scale
+        def __set__(self, value):
+            self._scale = value
+            self._update_values()
+
+    property offset:
+        def __get__(self):
+            return self._offset
+        def __set__(self, value):
+            self._offset = value
+            self._update_values()
+
+    cpdef setup(self):
+        super(ConstantParameter, self).setup()
+        self._update_values()
+
+    cpdef reset(self):
+        super(ConstantParameter, self).reset()
+        self._update_values()
+
+    cdef _update_values(self):
+        # The value is the same for every timestep, therefore the entire array is
+        # set only when the value changes rather than in every call to `calc_values`.
+        if self.__values is not None:
+            self.__values[...] = self._offset + self._value * self._scale
 
     cdef calc_values(self, Timestep timestep):
-        # constant parameter can just set the entire array to one value
-        self.__values[...] = self.offset + self._value * self.scale
+        # values are set by `_update_values`
+        pass
 
     cpdef double value(self, Timestep ts, ScenarioIndex scenario_index) except? -1:
         return self._value
 
     cpdef set_double_variables(self, double[:] values):
         self._value = values[0]
+        self._update_values()
 
     cpdef double[:] get_double_variables(self):
         return np.array([self._value, ], dtype=np.float64)
@@ -187,7 +218,9 @@ cdef class DataFrameParameter(Parameter):
             if self.scenario.size != dataframe_resampled.shape[1]:
                 raise ValueError("Scenario size ({}) is different to the number of columns ({}) "
                                  "in the DataFrame input.".format(self.scenario.size, dataframe_resampled.shape[1]))
-        self._values = dataframe_resampled.values.astype(np.float64)
+        # Copy to a row-major array so all scenarios for a timestep are adjacent in memory. An explicit
+        # copy is always made so the parameter never holds a (possibly read-only) view of the user's data.
+        self._values = np.array(dataframe_resampled.values, dtype=np.float64, order='C')
         if self.scenario is not None:
             self._scenario_index = self.model.scenarios.get_scenario_index(self.scenario)
 
@@ -342,7 +375,7 @@ cdef class TablesArrayParameter(IndexParameter):
             # if possible, only load the data required
             scenario_indices = None
             # Default to index that is just out of bounds to cause IndexError if something goes wrong
-            self._scenario_ids = np.ones(self.scenario.size, dtype=np.int32) * self.scenario.size
+            self._scenario_ids = np.full(self.scenario.size, self.scenario.size, dtype=np.int32)
 
             # Calculate the scenario indices to load dependning on how scenario combinations are defined.
             if self.model.scenarios.user_combinations:
@@ -583,7 +616,7 @@ cdef class WeeklyProfileParameter(Parameter):
 
     cpdef double value(self, Timestep ts, ScenarioIndex scenario_index) except? -1:
         cdef int i = ts.dayofyear - 1
-        if not is_leap_year(<int>(ts.datetime.year)):
+        if not is_leap_year(<int>(ts.year)):
             if i > 58: # 28th Feb
                 i += 1
         cdef Py_ssize_t week
@@ -634,8 +667,8 @@ cdef class MonthlyProfileParameter(Parameter):
             raise ValueError("12 values must be given for a monthly profile.")
         self._values = np.array(values)
         self.interp_day = interp_day
-        self._lower_bounds = np.ones(self.double_size)*lower_bounds
-        self._upper_bounds = np.ones(self.double_size)*upper_bounds
+        self._lower_bounds = np.full(self.double_size, lower_bounds, dtype=np.float64)
+        self._upper_bounds = np.full(self.double_size, upper_bounds, dtype=np.float64)
 
     cpdef reset(self):
         Parameter.reset(self)
@@ -696,8 +729,8 @@ cdef class MonthlyProfileParameter(Parameter):
         self._values[...] = values
 
     cpdef double[:] get_double_variables(self):
-        # Make sure we return a copy of the data instead of a view.
-        return np.array(self._values).copy()
+        # Make sure we return a copy of the data instead of a view; `np.array` copies by default.
+        return np.array(self._values)
 
     cpdef double[:] get_double_lower_bounds(self):
         return self._lower_bounds
@@ -1064,10 +1097,10 @@ cdef class AnnualHarmonicSeriesParameter(Parameter):
 
         self._mean_lower_bounds = kwargs.pop('mean_lower_bounds', 0.0)
         self._mean_upper_bounds = kwargs.pop('mean_upper_bounds', np.inf)
-        self._amplitude_lower_bounds = np.ones(n)*kwargs.pop('amplitude_lower_bounds', 0.0)
-        self._amplitude_upper_bounds = np.ones(n)*kwargs.pop('amplitude_upper_bounds', np.inf)
-        self._phase_lower_bounds = np.ones(n)*kwargs.pop('phase_lower_bounds', 0.0)
-        self._phase_upper_bounds = np.ones(n)*kwargs.pop('phase_upper_bounds', np.pi*2)
+        self._amplitude_lower_bounds = np.full(n, kwargs.pop('amplitude_lower_bounds', 0.0), dtype=np.float64)
+        self._amplitude_upper_bounds = np.full(n, kwargs.pop('amplitude_upper_bounds', np.inf), dtype=np.float64)
+        self._phase_lower_bounds = np.full(n, kwargs.pop('phase_lower_bounds', 0.0), dtype=np.float64)
+        self._phase_upper_bounds = np.full(n, kwargs.pop('phase_upper_bounds', np.pi*2), dtype=np.float64)
         super(AnnualHarmonicSeriesParameter, self).__init__(model, *args, **kwargs)
         # Size must be set after call to super.
         self.double_size = 1 + 2*n
@@ -1112,7 +1145,7 @@ cdef class AnnualHarmonicSeriesParameter(Parameter):
         return val
 
     cpdef set_double_variables(self, double[:] values):
-        n = len(self.amplitudes)
+        cdef int n = self._amplitudes.shape[0]
         self.mean = values[0]
         self._amplitudes[...] = values[1:n+1]
         self._phases[...] = values[n+1:]
@@ -1174,9 +1207,10 @@ cdef class AggregatedParameter(Parameter):
     def __init__(self, model, parameters, agg_func=None, **kwargs):
         super(AggregatedParameter, self).__init__(model, **kwargs)
         self.agg_func = agg_func
-        self.parameters = list(parameters)
-        for parameter in self.parameters:
-            self.children.add(parameter)
+        self.parameters = []
+        for parameter in parameters:
+            # Duplicates are ignored by `add`
+            self.add(parameter)
 
     @classmethod
     def load(cls, model, data):
@@ -1206,12 +1240,16 @@ cdef class AggregatedParameter(Parameter):
             self._agg_func = agg_func
 
     cpdef add(self, Parameter parameter):
+        # The parameters are kept in a list so the aggregation order is deterministic,
+        # but duplicates are not permitted to retain set-like behaviour.
+        if parameter in self.parameters:
+            return
         self.parameters.append(parameter)
         parameter.parents.add(self)
 
     cpdef remove(self, Parameter parameter):
         self.parameters.remove(parameter)
-        parameter.parent.remove(self)
+        parameter.parents.remove(self)
 
     def __len__(self):
         return len(self.parameters)
@@ -1219,6 +1257,13 @@ cdef class AggregatedParameter(Parameter):
     cpdef setup(self):
         super(AggregatedParameter, self).setup()
         assert(len(self.parameters))
+        # Scratch buffer for the median aggregation; only allocated when it is first used
+        self._buffer = None
+
+    cpdef double value(self, Timestep timestep, ScenarioIndex scenario_index) except? -1:
+        """Returns the current aggregated value"""
+        # The aggregation of the child values for this timestep is computed in `calc_values`
+        return self.get_value(scenario_index)
 
     cdef calc_values(self, Timestep timestep):
         cdef Parameter parameter
@@ -1232,33 +1277,33 @@ cdef class AggregatedParameter(Parameter):
         if self._agg_func == AggFuncs.PRODUCT:
             accum[...] = 1.0
             for parameter in self.parameters:
-                values = parameter.get_all_values()
+                values = parameter.__values
                 for i in range(n):
                     accum[i] *= values[i]
         elif self._agg_func == AggFuncs.SUM:
             accum[...] = 0.0
             for parameter in self.parameters:
-                values = parameter.get_all_values()
+                values = parameter.__values
                 for i in range(n):
                     accum[i] += values[i]
         elif self._agg_func == AggFuncs.MAX:
             accum[...] = np.NINF
             for parameter in self.parameters:
-                values = parameter.get_all_values()
+                values = parameter.__values
                 for i in range(n):
                     if values[i] > accum[i]:
                         accum[i] = values[i]
         elif self._agg_func == AggFuncs.MIN:
             accum[...] = np.PINF
             for parameter in self.parameters:
-                values = parameter.get_all_values()
+                values = parameter.__values
                 for i in range(n):
                     if values[i] < accum[i]:
                         accum[i] = values[i]
         elif self._agg_func == AggFuncs.MEAN:
             accum[...] = 0.0
             for parameter in self.parameters:
-                values = parameter.get_all_values()
+                values = parameter.__values
                 for i in range(n):
                     accum[i] += values[i]
 
@@ -1267,8 +1312,15 @@ cdef class AggregatedParameter(Parameter):
                 accum[i] /= nparam
 
         elif self._agg_func == AggFuncs.MEDIAN:
-            for i, scenario_index in enumerate(self.model.scenarios.combinations):
-                accum[i] = np.median([parameter.get_value(scenario_index) for parameter in self.parameters])
+            # Scratch buffer of the child values; reused between timesteps
+            nparam = len(self.parameters)
+            if self._buffer is None or self._buffer.shape[0] != nparam or self._buffer.shape[1] != n:
+                self._buffer = np.empty([nparam, n], np.float64)
+            for i, parameter in enumerate(self.parameters):
+                self._buffer[i, :] = parameter.__values
+            # Compute the median for all scenarios in a single call. The buffer is scratch space
+            # so numpy may partition it in place rather than copying it.
+            np.median(np.asarray(self._buffer), axis=0, out=np.asarray(accum), overwrite_input=True)
         elif self._agg_func == AggFuncs.CUSTOM:
             for i, scenario_index in enumerate(self.model.scenarios.combinations):
                 accum[i] = self._agg_user_func([parameter.get_value(scenario_index) for parameter in self.parameters])
@@ -1294,9 +1346,10 @@ cdef class AggregatedIndexParameter(IndexParameter):
     def __init__(self, model, parameters, agg_func=None, **kwargs):
         super(AggregatedIndexParameter, self).__init__(model, **kwargs)
         self.agg_func = agg_func
-        self.parameters = list(parameters)
-        for parameter in self.parameters:
-            self.children.add(parameter)
+        self.parameters = []
+        for parameter in parameters:
+            # Duplicates are ignored by `add`
+            self.add(parameter)
 
     @classmethod
     def load(cls, model, data):
@@ -1326,12 +1379,16 @@ cdef class AggregatedIndexParameter(IndexParameter):
             self._agg_func = agg_func
 
     cpdef add(self, Parameter parameter):
+        # The parameters are kept in a list so the aggregation order is deterministic,
+        # but duplicates are not permitted to retain set-like behaviour.
+        if parameter in self.parameters:
+            return
         self.parameters.append(parameter)
         parameter.parents.add(self)
 
     cpdef remove(self, Parameter parameter):
         self.parameters.remove(parameter)
-        parameter.parent.remove(self)
+        parameter.parents.remove(self)
 
     def __len__(self):
         return len(self.parameters)
@@ -1341,6 +1398,11 @@ cdef class AggregatedIndexParameter(IndexParameter):
         assert len(self.parameters)
         assert all([isinstance(parameter, IndexParameter) for parameter in self.parameters])
 
+    cpdef int index(self, Timestep timestep, ScenarioIndex scenario_index) except? -1:
+        """Returns the current aggregated index"""
+        # The aggregation of the child indices for this timestep is computed in `calc_values`
+        return self.get_index(scenario_index)
+
     cdef calc_values(self, Timestep timestep):
         cdef IndexParameter parameter
         cdef int[:] accum = self.__indices  # View of the underlying location for the data
@@ -1353,40 +1415,40 @@ cdef class AggregatedIndexParameter(IndexParameter):
         if self._agg_func == AggFuncs.PRODUCT:
             accum[...] = 1
             for parameter in self.parameters:
-                values = parameter.get_all_indices()
+                values = parameter.__indices
                 for i in range(n):
                     accum[i] *= values[i]
         elif self._agg_func == AggFuncs.SUM:
             accum[...] = 0
             for parameter in self.parameters:
-                values = parameter.get_all_indices()
+                values = parameter.__indices
                 for i in range(n):
                     accum[i] += values[i]
         elif self._agg_func == AggFuncs.MAX:
             accum[...] = INT_MIN
             for parameter in self.parameters:
-                values = parameter.get_all_indices()
+                values = parameter.__indices
                 for i in range(n):
                     if values[i] > accum[i]:
                         accum[i] = values[i]
         elif self._agg_func == AggFuncs.MIN:
             accum[...] = INT_MAX
             for parameter in self.parameters:
-                values = parameter.get_all_indices()
+                values = parameter.__indices
                 for i in range(n):
                     if values[i] < accum[i]:
                         accum[i] = values[i]
         elif self._agg_func == AggFuncs.ANY:
             accum[...] = 0
             for parameter in self.parameters:
-                values = parameter.get_all_indices()
+                values = parameter.__indices
                 for i in range(n):
                     if values[i]:
                         accum[i] = 1
         elif self._agg_func == AggFuncs.ALL:
             accum[...] = 1
             for parameter in self.parameters:
-                values = parameter.get_all_indices()
+                values = parameter.__indices
                 for i in range(n):
                     if not values[i]:
                         accum[i] = 0
@@ -1459,6 +1521,40 @@ cdef class DivisionParameter(Parameter):
 DivisionParameter.register()
 
 
+cdef class ScaledProfileParameter(Parameter):
+    """ Parameter that scales the value of another `Parameter` by a constant factor
+
+    Parameters
+    ----------
+    scale : float
+        The factor to multiply the profile by.
+    profile : `Parameter`
+        The parameter (e.g. a `MonthlyProfileParameter`) to scale.
+    """
+    def __init__(self, model, scale, profile, *args, **kwargs):
+        super(ScaledProfileParameter, self).__init__(model, *args, **kwargs)
+        self.scale = scale
+        self.profile = profile
+        self.children.add(profile)
+
+    cdef calc_values(self, Timestep timestep):
+        cdef int i
+        cdef int n = self.__values.shape[0]
+
+        for i in range(n):
+            self.__values[i] = self.scale * self.profile.__values[i]
+
+    cpdef double value(self, Timestep ts, ScenarioIndex scenario_index) except? -1:
+        return self.scale * self.profile.get_value(scenario_index)
+
+    @classmethod
+    def load(cls, model, data):
+        scale = float(data.pop("scale"))
+        profile = load_parameter(model, data.pop("profile"))
+        return cls(model, scale, profile, **data)
+ScaledProfileParameter.register()
+
+
 cdef class NegativeParameter(Parameter):
     """ Parameter that takes negative of another `Parameter`
 
@@ -1755,22 +1851,21 @@ def load_parameter(model, data, parameter_name=None):
     """Load a parameter from a dict"""
     if isinstance(data, str):
         # parameter is a reference
-        try:
-            parameter = model.parameters[data]
-        except KeyError:
-            parameter = None
+        name = data
+        parameter = None
+        if hasattr(model, "_loaded_parameters"):
+            # we're loading data from JSON; parameters loaded by name so far are
+            # cached to avoid searching all of the model's components
+            parameter = model._loaded_parameters.get(name)
+        if parameter is None and name in getattr(model, "_parameters_to_load", ()):
+            # we're still in the process of loading data from JSON and
+            # the parameter requested hasn't been loaded yet - do it now
+            parameter = load_parameter(model, model._parameters_to_load.pop(name))
         if parameter is None:
-            if hasattr(model, "_parameters_to_load"):
-                # we're still in the process of loading data from JSON and
-                # the parameter requested hasn't been loaded yet - do it now
-                name = data
-                try:
-                    data = model._parameters_to_load.pop(name)
-                except KeyError:
-                    raise KeyError("Unknown parameter: '{}'".format(data))
-                parameter = load_parameter(model, data)
-            else:
-                raise KeyError("Unknown parameter: '{}'".format(data))
+            try:
+                parameter = model.parameters[name]
+            except KeyError:
+                raise KeyError("Unknown parameter: '{}'".format(name))
     elif isinstance(data, (float, int)) or data is None:
         # parameter is a constant
         parameter = data
@@ -1793,7 +1888,8 @@ def load_parameter(model, data, parameter_name=None):
     if parameter_name is not None:
         # TODO FIXME: memory leak if parameter is subsequently removed from the model
         parameter.name = parameter_name
-        model.parameters[parameter_name] = parameter
+        if hasattr(model, "_loaded_parameters"):
+            model._loaded_parameters[parameter_name] = parameter
 
     return parameter
 
@@ -1826,7 +1922,7 @@ def load_parameter_values(model, data, values_key='values', url_key='url',
             values = df.values
         except AttributeError:
             values = df
-        values = np.squeeze(values.astype(np.float64))
+        values = np.squeeze(np.array(values, dtype=np.float64, order='C'))
     else:
         # Try to get some useful information about the parameter for the error message
         name = data.get('name', None)
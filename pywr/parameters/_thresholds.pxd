@@ -31,4 +31,4 @@ cdef class CurrentYearThresholdParameter(AbstractThresholdParameter):
     pass
 
 cdef class CurrentOrdinalDayThresholdParameter(AbstractThresholdParameter):
-    pass
+    cdef int[:] _ordinals
@@ -273,8 +273,16 @@ CurrentYearThresholdParameter.register()
 cdef class CurrentOrdinalDayThresholdParameter(AbstractThresholdParameter):
     """ Returns one of two values depending on the ordinal of the current timestep.
     """
+    cpdef setup(self):
+        super(CurrentOrdinalDayThresholdParameter, self).setup()
+        # Ordinal of the start of each timestep (i.e. `timestep.datetime.toordinal()`). These are
+        # computed once here to avoid creating a timestamp for every timestep. The ordinal is the
+        # number of days since the epoch plus the ordinal of 1970-01-01.
+        days = self.model.timestepper.datetime_index.to_timestamp().values.astype('datetime64[D]').astype(np.int64)
+        self._ordinals = (days + 719163).astype(np.int32)
+
     cpdef double _value_to_compare(self, Timestep timestep, ScenarioIndex scenario_index) except? -1:
-        return float(timestep.datetime.toordinal())
+        return <double>self._ordinals[timestep.index]
 
     @classmethod
     def load(cls, model, data):
@@ -10,17 +10,18 @@ from ._parameters import (
     ArrayIndexedScenarioParameter, ScenarioMonthlyProfileParameter, ScenarioDailyProfileParameter,
     ScenarioWeeklyProfileParameter, align_and_resample_dataframe, DataFrameParameter,
     IndexParameter, AggregatedParameter, AggregatedIndexParameter, PiecewiseIntegralParameter,
-    NegativeParameter, MaxParameter, NegativeMaxParameter, MinParameter, NegativeMinParameter,
-    DeficitParameter, DivisionParameter, load_parameter, load_parameter_values, load_dataframe)
+    ScaledProfileParameter, NegativeParameter, MaxParameter, NegativeMaxParameter, MinParameter,
+    NegativeMinParameter, DeficitParameter, DivisionParameter, load_parameter, load_parameter_values, load_dataframe)
 from . import licenses
 from ._polynomial import Polynomial1DParameter, Polynomial2DStorageParameter
 from ._thresholds import StorageThresholdParameter, RecorderThresholdParameter
 from ._hydropower import HydropowerTargetParameter
 import numpy as np
-from scipy.interpolate import interp1d
-from scipy.integrate import quad
 import pandas
 
+# `scipy.integrate.quad`; imported by `InterpolatedQuadratureParameter.setup` when first required
+_quad = None
+
 
 class FunctionParameter(Parameter):
     def __init__(self, model, parent, func, *args, **kwargs):
@@ -33,32 +34,14 @@ class FunctionParameter(Parameter):
 FunctionParameter.register()
 
 
-class ScaledProfileParameter(Parameter):
-    def __init__(self, model, scale, profile, *args, **kwargs):
-        super(ScaledProfileParameter, self).__init__(model, *args, **kwargs)
-        self.scale = scale
-
-        profile.parents.add(self)
-        self.profile = profile
-
-    @classmethod
-    def load(cls, model, data):
-        scale = float(data.pop("scale"))
-        profile = load_parameter(model, data.pop("profile"))
-        return cls(model, scale, profile, **data)
-
-    def value(self, ts, si):
-        p = self.profile.get_value(si)
-        return self.scale * p
-ScaledProfileParameter.register()
-
-
 class AbstractInterpolatedParameter(Parameter):
     def __init__(self, model, x, y, interp_kwargs=None, **kwargs):
         super(AbstractInterpolatedParameter, self).__init__(model, **kwargs)
         self.x = x
         self.y = y
         self.interp = None
+        self._interp_x = None
+        self._interp_y = None
         default_interp_kwargs = dict(kind='linear', bounds_error=True)
         if interp_kwargs is not None:
             # Overwrite or add to defaults with given values
@@ -70,11 +53,25 @@ class AbstractInterpolatedParameter(Parameter):
 
     def setup(self):
         super(AbstractInterpolatedParameter, self).setup()
+        # scipy is only imported when required to keep the import of pywr light
+        from scipy.interpolate import interp1d
         self.interp = interp1d(self.x, self.y, **self.interp_kwargs)
+        # The default linear interpolation can use `np.interp` directly, which avoids
+        # the overhead of calling the `interp1d` instance with a single value.
+        self._interp_x = None
+        self._interp_y = None
+        if self.interp_kwargs == dict(kind='linear', bounds_error=True) and np.ndim(self.y) == 1:
+            order = np.argsort(self.x, kind='mergesort')
+            self._interp_x = np.asarray(self.x, dtype=np.float64)[order]
+            self._interp_y = np.asarray(self.y, dtype=np.float64)[order]
 
     def value(self, ts, scenario_index):
         v = self._value_to_interpolate(ts, scenario_index)
-        return self.interp(v)
+        x = self._interp_x
+        if x is None or v < x[0] or v > x[-1]:
+            # Out of bounds values are passed to `interp1d` to raise the appropriate error
+            return self.interp(v)
+        return np.interp(v, x, self._interp_y)
 
 
 class InterpolatedParameter(AbstractInterpolatedParameter):
@@ -189,13 +186,19 @@ class InterpolatedQuadratureParameter(AbstractInterpolatedParameter):
     def _value_to_interpolate(self, ts, scenario_index):
         return self._upper_parameter.get_value(scenario_index)
 
+    def setup(self):
+        super(InterpolatedQuadratureParameter, self).setup()
+        global _quad
+        if _quad is None:
+            from scipy.integrate import quad as _quad
+
     def value(self, ts, scenario_index):
         a = 0
         if self._lower_parameter is not None:
             a = self._lower_parameter.get_value(scenario_index)
         b = self._value_to_interpolate(ts, scenario_index)
 
-        cost, err = quad(self.interp, a, b)
+        cost, err = _quad(self.interp, a, b)
         return cost
 
     @classmethod
@@ -289,8 +292,27 @@ def pop_kwarg_parameter(kwargs, key, default):
 
 
 class PropertiesDict(dict):
+    """A dictionary of `Parameter` instances
+
+    Values which are not already a `Parameter` are wrapped in a
+    `ConstantParameter` when they are set. Callers which already know the
+    type of the value can use `set_parameter` or `set_constant` to avoid
+    the type check.
+    """
+    def __init__(self, model, *args, **kwargs):
+        self.model = model
+        super(PropertiesDict, self).__init__()
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
     def __setitem__(self, key, value):
-        if not isinstance(value, Property):
-            value = ConstantParameter(value)
+        if not isinstance(value, Parameter):
+            value = ConstantParameter(self.model, value)
         dict.__setitem__(self, key, value)
 
+    def set_parameter(self, key, parameter):
+        dict.__setitem__(self, key, parameter)
+
+    def set_constant(self, key, value):
+        dict.__setitem__(self, key, ConstantParameter(self.model, value))
+
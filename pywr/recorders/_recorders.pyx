@@ -1,6 +1,5 @@
 import numpy as np
 cimport numpy as np
-from scipy.stats import percentileofscore
 import pandas as pd
 import warnings
 
@@ -80,16 +79,19 @@ cdef class Aggregator:
         if ignore_nan:
             values = np.array(values)[~np.isnan(values)]
 
+        # Use the ufunc reductions directly on an array view; this avoids the
+        # generic wrappers (e.g. `np.sum`) converting the memoryview each call.
+        arr = np.asarray(values)
         if self._func == AggFuncs.PRODUCT:
-            return np.product(values)
+            return np.multiply.reduce(arr)
         elif self._func == AggFuncs.SUM:
-            return np.sum(values)
+            return np.add.reduce(arr)
         elif self._func == AggFuncs.MAX:
-            return np.max(values)
+            return np.maximum.reduce(arr)
         elif self._func == AggFuncs.MIN:
-            return np.min(values)
+            return np.minimum.reduce(arr)
         elif self._func == AggFuncs.MEAN:
-            return np.mean(values)
+            return arr.mean()
         elif self._func == AggFuncs.MEDIAN:
             return np.median(values)
         elif self._func == AggFuncs.CUSTOM:
@@ -97,6 +99,7 @@ cdef class Aggregator:
         elif self._func == AggFuncs.PERCENTILE:
             return np.percentile(values, *self.func_args, **self.func_kwargs)
         elif self._func == AggFuncs.PERCENTILEOFSCORE:
+            from scipy.stats import percentileofscore
             return percentileofscore(values, *self.func_args, **self.func_kwargs)
         else:
             raise ValueError('Aggregation function code "{}" not recognised.'.format(self._func))
@@ -110,16 +113,17 @@ cdef class Aggregator:
         if ignore_nan:
             values = np.array(values)[~np.isnan(values)]
 
+        arr = np.asarray(values)
         if self._func == AggFuncs.PRODUCT:
-            return np.product(values, axis=axis)
+            return np.multiply.reduce(arr, axis=axis)
         elif self._func == AggFuncs.SUM:
-            return np.sum(values, axis=axis)
+            return np.add.reduce(arr, axis=axis)
         elif self._func == AggFuncs.MAX:
-            return np.max(values, axis=axis)
+            return np.maximum.reduce(arr, axis=axis)
         elif self._func == AggFuncs.MIN:
-            return np.min(values, axis=axis)
+            return np.minimum.reduce(arr, axis=axis)
         elif self._func == AggFuncs.MEAN:
-            return np.mean(values, axis=axis)
+            return arr.mean(axis=axis)
         elif self._func == AggFuncs.MEDIAN:
             return np.median(values, axis=axis)
         elif self._func == AggFuncs.CUSTOM:
@@ -127,6 +131,7 @@ cdef class Aggregator:
         elif self._func == AggFuncs.PERCENTILE:
             return np.percentile(values, *self.func_args, axis=axis, **self.func_kwargs)
         elif self._func == AggFuncs.PERCENTILEOFSCORE:
+            from scipy.stats import percentileofscore
             # percentileofscore doesn't support the axis argument
             # we must therefore iterate over the array
             if axis == 0:
@@ -62,6 +62,21 @@ class TestDownSampling:
         pd.testing.assert_index_equal(input_resampled.index, model_index)
         pd.testing.assert_frame_equal(input_resampled, input_resampled.resample('7D').agg(resample_func))
 
+    @pytest.mark.parametrize('missing', [False, True])
+    def test_hourly_to_daily_mean(self, missing):
+        """Test hourly data to daily model time-step matches the pandas mean."""
+        input_df = make_df('H', start='2014-12-31 12:00', end='2015-02-01 06:00')
+        input_df[1] = input_df[0] * 2
+        if missing:
+            input_df.iloc[100, 0] = np.nan
+        model_index = make_model_index('D', end='2015-01-31')
+
+        input_resampled = align_and_resample_dataframe(input_df, model_index)
+
+        expected_df = input_df['2015-01-01':'2015-01-31'].resample('D').mean()
+        pd.testing.assert_index_equal(input_resampled.index, model_index)
+        pd.testing.assert_frame_equal(input_resampled, expected_df)
+
     @pytest.mark.parametrize('resample_func', ['mean', 'max'])
     def test_weekly_to_monthly(self, resample_func):
         """Test weekly to monthly model time-step."""
@@ -83,6 +98,22 @@ class TestDownSampling:
         pd.testing.assert_frame_equal(input_resampled, input_resampled.resample('2W').agg(resample_func))
 
 
+class TestSameFrequency:
+    """Test for data which is already at the model time-step."""
+
+    @pytest.mark.parametrize('freq', ['D', '7D', 'W', 'M'])
+    def test_same_frequency(self, freq):
+        """Test data at the model time-step is only sliced to the model index."""
+        input_df = make_df(freq, start='2014-12-04', end='2016-12-31')
+        model_index = make_model_index(freq)
+
+        input_resampled = align_and_resample_dataframe(input_df, model_index)
+
+        expected_df = input_df[model_index[0]:model_index[-1]]
+        pd.testing.assert_index_equal(input_resampled.index, model_index)
+        pd.testing.assert_frame_equal(input_resampled, expected_df)
+
+
 class TestUpSampling:
     """Test for up-sampling a dataframe to higher frequency model time-step."""
 
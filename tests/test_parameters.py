@@ -9,7 +9,7 @@ from pywr.parameters import (Parameter, ArrayIndexedParameter, ConstantScenarioP
     ScenarioWeeklyProfileParameter, Polynomial1DParameter, Polynomial2DStorageParameter, ArrayIndexedScenarioParameter,
     InterpolatedParameter, WeeklyProfileParameter, InterpolatedQuadratureParameter, PiecewiseIntegralParameter,
     FunctionParameter, AnnualHarmonicSeriesParameter, load_parameter, InterpolatedFlowParameter,
-    ScenarioDailyProfileParameter)
+    ScenarioDailyProfileParameter, PropertiesDict, NegativeParameter)
 from pywr.recorders import AssertionRecorder, assert_rec
 from pywr.model import OrphanedParameterWarning
 from pywr.dataframe_tools import ResamplingError
@@ -86,6 +86,24 @@ class TestConstantParameter:
         with pytest.raises(NotImplementedError):
             p.get_integer_variables()
 
+    def test_scale_offset(self, simple_linear_model):
+        """ Test the values of `ConstantParameter` are updated when the scale, offset or value change """
+        model = simple_linear_model
+        p = ConstantParameter(model, 2.0, scale=1.5, offset=0.5)
+        model.setup()
+        si = ScenarioIndex(0, np.array([0], dtype=np.int32))
+        np.testing.assert_allclose(p.get_value(si), 3.5)
+
+        p.scale = 2.0
+        np.testing.assert_allclose(p.get_value(si), 4.5)
+        p.offset = 1.0
+        np.testing.assert_allclose(p.get_value(si), 5.0)
+        p.set_double_variables(np.array([1.0, ]))
+        np.testing.assert_allclose(p.get_value(si), 3.0)
+
+        model.run()
+        np.testing.assert_allclose(p.get_value(si), 3.0)
+
 
 def test_parameter_array_indexed(simple_linear_model):
     """
@@ -284,6 +302,18 @@ class TestMonthlyProfileParameter:
             return values[(imth - 1) % 12] * (1 - x) + values[imth] * x
         model.run()
 
+    def test_variable(self, model):
+        """Test that variable updating works and returns a copy of the values."""
+        p = MonthlyProfileParameter(model, np.arange(12, dtype=np.float64), is_variable=True)
+
+        new_var = np.arange(12, dtype=np.float64) * 2
+        p.set_double_variables(new_var)
+        variables = np.asarray(p.get_double_variables())
+        np.testing.assert_allclose(variables, new_var)
+
+        variables[0] = 100.0
+        np.testing.assert_allclose(p.get_double_variables(), new_var)
+
 
 class TestScenarioMonthlyProfileParameter:
 
@@ -535,6 +565,35 @@ class TestAggregatedParameter:
 
         model.run()
 
+    @pytest.mark.parametrize("agg_func", ["min", "max", "mean", "median", "sum", "product", "custom"])
+    def test_value(self, simple_linear_model, agg_func):
+        """ Test `value` matches the aggregation of the child values """
+        model = simple_linear_model
+        model.timestepper.delta = 15
+
+        scenarioB = Scenario(model, "Scenario B", size=5)
+
+        p1 = DailyProfileParameter(model, np.arange(366, dtype=np.float64))
+        p2 = ConstantScenarioParameter(model, scenarioB, np.arange(scenarioB.size, dtype=np.float64))
+        p3 = ConstantParameter(model, 3.0, scale=2.0, offset=1.0)
+        # A child which only implements `calc_values`
+        p4 = NegativeParameter(model, p2)
+        children = [p1, p2, p3, p4]
+
+        if agg_func == "custom":
+            func = agg_func = lambda values: custom_test_func(np.array(values))
+        else:
+            func = dict(TestAggregatedParameter.funcs, product=np.prod)[agg_func]
+        p = AggregatedParameter(model, children, agg_func=agg_func)
+
+        @assert_rec(model, p)
+        def expected_func(timestep, scenario_index):
+            values = np.array([child.get_value(scenario_index) for child in children])
+            assert_allclose(p.value(timestep, scenario_index), func(values))
+            return func(values)
+
+        model.run()
+
     def test_load(self, simple_linear_model):
         """ Test load from JSON dict"""
         model = simple_linear_model
@@ -569,6 +628,35 @@ class TestAggregatedParameter:
         p.agg_func = "product"
         assert p.agg_func == "product"
 
+    def test_add_remove(self, model):
+        """ Test adding and removing parameters preserves order and children """
+        p1 = ConstantParameter(model, 1.0)
+        p2 = ConstantParameter(model, 2.0)
+        p3 = ConstantParameter(model, 3.0)
+        p = AggregatedParameter(model, [p1, p2], agg_func="sum")
+
+        p.add(p3)
+        p.add(p1)  # duplicates are ignored
+        assert p.parameters == [p1, p2, p3]
+        assert len(p) == 3
+        assert p3 in p.children
+
+        p.remove(p2)
+        assert p.parameters == [p1, p3]
+        assert p2 not in p.children
+
+    @pytest.mark.parametrize("cls", [AggregatedParameter, AggregatedIndexParameter])
+    def test_init_duplicates(self, model, cls):
+        """ Test duplicate parameters given to the constructor are ignored """
+        p1 = ConstantParameter(model, 1.0)
+        p2 = ConstantParameter(model, 2.0)
+        p = cls(model, [p1, p1, p2], agg_func="sum")
+        assert p.parameters == [p1, p2]
+
+        p.remove(p1)
+        assert p.parameters == [p2]
+        assert p1 not in p.children
+
 
 class DummyIndexParameter(IndexParameter):
     """A simple IndexParameter which returns a constant value"""
@@ -605,7 +693,9 @@ class TestAggregatedIndexParameter:
         def expected_func(timestep, scenario_index):
             x = p1.get_index(scenario_index)
             y = p2.get_index(scenario_index)
-            return func(np.array([x,y], np.int32))
+            expected = func(np.array([x,y], np.int32))
+            assert p.index(timestep, scenario_index) == expected
+            return expected
 
         model.run()
 
@@ -648,6 +738,24 @@ class TestAggregatedIndexParameter:
         assert p.agg_func == "product"
 
 
+def test_properties_dict(model):
+    """ Test `PropertiesDict` wraps values which are not parameters in `ConstantParameter` """
+    p1 = ConstantParameter(model, 1.0)
+    props = PropertiesDict(model, a=p1, b=2.0)
+    assert props["a"] is p1
+    assert isinstance(props["b"], ConstantParameter)
+
+    props["c"] = 3.0
+    props.set_constant("d", 4.0)
+    props.set_parameter("e", p1)
+    assert isinstance(props["c"], ConstantParameter)
+    assert isinstance(props["d"], ConstantParameter)
+    assert props["e"] is p1
+
+    for key, value in [("b", 2.0), ("c", 3.0), ("d", 4.0)]:
+        np.testing.assert_allclose(props[key].get_double_variables(), [value])
+
+
 def test_parameter_child_variables(model):
 
     p1 = Parameter(model)
@@ -762,6 +870,22 @@ def test_parameter_df_upsampling(model):
         p.setup()
 
 
+def test_parameter_df_read_only(simple_linear_model):
+    """ Test that the `DataFrameParameter` works with read-only data at the model time-step """
+    model = simple_linear_model
+    values = np.arange(365, dtype=np.float64)
+    values.flags.writeable = False
+    series = pd.Series(values, index=pd.period_range('2015-01-01', periods=365, freq='D'))
+
+    p = DataFrameParameter(model, series)
+
+    @assert_rec(model, p)
+    def expected_func(timestep, scenario_index):
+        return values[timestep.index]
+
+    model.run()
+
+
 def test_parameter_df_upsampling_multiple_columns(model):
     """ Test that the `DataFrameParameter` works with multiple columns that map to a `Scenario`
     """
@@ -845,6 +969,25 @@ def test_simple_json_parameter_reference():
     assert(len(model.parameters) == 4)  # 4 parameters defined
 
 
+def test_json_parameter_reference_cache():
+    """ Test forward and repeated references to a named parameter resolve to the same instance """
+    with open(os.path.join(TEST_DIR, "models", "parameter_reference.json")) as fh:
+        data = json.load(fh)
+    # "aggregated_cost" is loaded first and refers to both parameters before they are loaded;
+    # "negative_cost" then refers to "demand_cost" again once it has been loaded.
+    data["parameters"]["negative_cost"] = {"type": "negative", "parameter": "demand_cost"}
+    data["parameters"]["aggregated_cost"] = {"type": "aggregated", "agg_func": "sum",
+                                             "parameters": ["demand_cost", "negative_cost"]}
+    model = load_model(data=json.dumps(data))
+
+    demand_cost = model.parameters["demand_cost"]
+    negative_cost = model.parameters["negative_cost"]
+    assert model.parameters["aggregated_cost"].parameters == [demand_cost, negative_cost]
+    assert negative_cost.parameter is demand_cost
+    assert model.nodes["demand1"].cost is demand_cost
+    assert len(model.parameters) == 6
+
+
 def test_threshold_parameter(simple_linear_model):
     model = simple_linear_model
     model.timestepper.delta = 150
@@ -1099,6 +1242,35 @@ def test_interpolated_parameter(simple_linear_model):
     model.run()
 
 
+def test_interpolated_parameter_unsorted(simple_linear_model):
+    """ Test linear interpolation with unsorted data """
+    model = simple_linear_model
+    model.timestepper.start = "1920-01-01"
+    model.timestepper.end = "1920-01-12"
+
+    p1 = ArrayIndexedParameter(model, [0,1,2,3,4,5,6,7,8,9,10,11])
+    p2 = InterpolatedParameter(model, p1, [10, 0, 11, 5], [10*3, 0, 2, 5*2])
+
+    @assert_rec(model, p2)
+    def expected_func(timestep, scenario_index):
+        values = [0, 2, 4, 6, 8, 10, 14, 18, 22, 26, 30, 2]
+        return values[timestep.index]
+    model.run()
+
+
+def test_interpolated_parameter_bounds_error(simple_linear_model):
+    """ Test linear interpolation raises an error for values outside of the bounds """
+    model = simple_linear_model
+    model.timestepper.start = "1920-01-01"
+    model.timestepper.end = "1920-01-12"
+
+    p1 = ArrayIndexedParameter(model, [0,1,2,3,4,5,6,7,8,9,10,11])
+    p2 = InterpolatedParameter(model, p1, [0, 5, 10], [0, 5*2, 10*3])
+
+    with pytest.raises(ValueError):
+        model.run()
+
+
 class TestInterpolatedQuadratureParameter:
 
     @pytest.mark.parametrize("lower_interval", [None, 0, 1])
@@ -1527,12 +1699,14 @@ class TestThresholdParameters:
 
         m.run()
 
-    def test_current_ordinal_threshold_parameter(self, simple_linear_model):
-        """Test CurrentYearThresholdParameter"""
+    @pytest.mark.parametrize("delta", [1, "W", "M"])
+    def test_current_ordinal_threshold_parameter(self, simple_linear_model, delta):
+        """Test CurrentOrdinalDayThresholdParameter compares the start of each timestep"""
         m = simple_linear_model
 
         m.timestepper.start = '2020-01-01'
         m.timestepper.end = '2030-01-01'
+        m.timestepper.delta = delta
 
         threshold = datetime.date(2025, 6, 15).toordinal()
 